@@ -3,10 +3,14 @@ from src.storage import (
     JSONVacancyStorage,
     CSVVacancyStorage,
     ExcelVacancyStorage,
-    TXTVacancyStorage
+    TXTVacancyStorage,
+    ParquetVacancyStorage,
+    SQLiteVacancyStorage
 )
 from src.managers import VacancyManager
+import asyncio
 import os
+import sys
 
 
 def user_interaction() -> None:
@@ -24,18 +28,22 @@ def user_interaction() -> None:
     print("2. CSV")
     print("3. Excel")
     print("4. TXT")
-    storage_choice = input("Введите номер варианта (1-4): ")
+    print("5. Parquet (по умолчанию)")
+    print("6. SQLite")
+    storage_choice = input("Введите номер варианта (1-6): ")
 
     storage_map = {
         "1": ("JSON", os.path.join(data_dir, "vacancies.json")),
         "2": ("CSV", os.path.join(data_dir, "vacancies.csv")),
         "3": ("Excel", os.path.join(data_dir, "vacancies.xlsx")),
         "4": ("TXT", os.path.join(data_dir, "vacancies.txt")),
+        "5": ("Parquet", os.path.join(data_dir, "vacancies.parquet")),
+        "6": ("SQLite", os.path.join(data_dir, "vacancies.db")),
     }
 
     if storage_choice not in storage_map:
-        print("Неверный выбор. Используется JSON по умолчанию.")
-        storage_choice = "1"
+        print("Неверный выбор. Используется Parquet по умолчанию.")
+        storage_choice = "5"
 
     storage_type, file_path = storage_map[storage_choice]
     print(f"Используется {storage_type} хранилище: {file_path}")
@@ -59,10 +67,12 @@ def _create_storage(storage_type: str, file_path: str):
         "JSON": JSONVacancyStorage,
         "CSV": CSVVacancyStorage,
         "Excel": ExcelVacancyStorage,
-        "TXT": TXTVacancyStorage
+        "TXT": TXTVacancyStorage,
+        "Parquet": ParquetVacancyStorage,
+        "SQLite": SQLiteVacancyStorage
     }
 
-    storage_class = storage_classes.get(storage_type, JSONVacancyStorage)
+    storage_class = storage_classes.get(storage_type, ParquetVacancyStorage)
     return storage_class(file_path)
 
 
@@ -98,7 +108,7 @@ def _handle_search_vacancies(manager: VacancyManager) -> None:
     """Обрабатывает поиск и сохранение вакансий."""
     search_query = input("Введите поисковый запрос (например: Python разработчик): ")
     try:
-        manager.fetch_and_store_vacancies(search_query)
+        asyncio.run(manager.fetch_and_store_vacancies(search_query))
         print(f"Вакансии по запросу '{search_query}' успешно сохранены.")
     except Exception as e:
         print(f"Ошибка при получении вакансий: {e}")
@@ -129,23 +139,9 @@ def _display_vacancies(vacancies, title: str) -> None:
         print("Вакансии не найдены.")
         return
 
-    for i, vacancy in enumerate(vacancies, 1):
-        salary = vacancy.get_salary()
-        salary_str = f"{salary} RUB" if salary else "Зарплата не указана"
-
-        print(f"{i}. {vacancy.title}")
-        print(f"   Ссылка: {vacancy.link}")
-        print(f"   Зарплата: {salary_str}")
-        print(f"   Описание: {_truncate_text(vacancy.description, 100)}")
-        print(f"   Требования: {_truncate_text(vacancy.requirements, 100)}")
-        print()
-
-
-def _truncate_text(text: str, max_length: int) -> str:
-    """Обрезает текст до указанной длины."""
-    if len(text) <= max_length:
-        return text
-    return text[:max_length] + "..."
+    sys.stdout.write("".join(
+        f"{i}. {vacancy.format_summary()}\n" for i, vacancy in enumerate(vacancies, 1)
+    ))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import abc
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 
 
 class VacancyAPI(abc.ABC):
@@ -9,3 +9,10 @@ class VacancyAPI(abc.ABC):
     def get_vacancies(self, search_query: str) -> List[Dict[str, Any]]:
         """Получает список вакансий по поисковому запросу."""
         pass
+
+    async def iter_vacancies(self, search_query: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Асинхронно отдает вакансии постранично.
+
+        По умолчанию вся выдача get_vacancies() отдается одной страницей.
+        """
+        yield self.get_vacancies(search_query)
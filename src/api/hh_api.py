@@ -1,21 +1,102 @@
-import requests
-from typing import List, Dict, Any
+import asyncio
+import collections
+import json
+
+import aiohttp
+from typing import List, Dict, Any, AsyncIterator, Tuple
 from .base import VacancyAPI
 
 
 class HHVacancyAPI(VacancyAPI):
     """Класс для работы с API hh.ru."""
 
+    max_workers = 8
+    cache_size = 128
+
     def __init__(self):
         self.base_url = "https://api.hh.ru/vacancies"
+        # Кэш выдачи по тексту запроса (LRU). Страницы хранятся JSON-строками,
+        # чтобы каждый вызов получал собственную копию данных и не мог испортить кэш.
+        self._cache: "collections.OrderedDict[str, Tuple[str, ...]]" = collections.OrderedDict()
 
     def get_vacancies(self, search_query: str) -> List[Dict[str, Any]]:
-        """Получает вакансии с hh.ru по поисковому запросу."""
-        params = {
+        """Получает вакансии с hh.ru по поисковому запросу со всех страниц выдачи."""
+        return asyncio.run(self._collect(search_query))
+
+    def clear_cache(self) -> None:
+        """Очищает кэш ответов API."""
+        self._cache.clear()
+
+    async def _collect(self, search_query: str) -> List[Dict[str, Any]]:
+        return [item async for page in self.iter_vacancies(search_query) for item in page]
+
+    async def iter_vacancies(self, search_query: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Асинхронно отдает вакансии с hh.ru постранично, по мере загрузки.
+
+        Повторный запрос с тем же текстом отдается из кэша без обращения к API.
+        Выдача попадает в кэш только после загрузки всех страниц.
+        """
+        cached = self._cache.get(search_query)
+        if cached is not None:
+            self._cache.move_to_end(search_query)
+            for page in cached:
+                yield json.loads(page)
+            return
+
+        pages = []
+        async for items in self._download_pages(search_query):
+            pages.append(json.dumps(items, ensure_ascii=False))
+            yield items
+        self._cache[search_query] = tuple(pages)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _download_pages(self, search_query: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Загружает страницы выдачи и отдает их по порядку.
+
+        Одновременно загружается не больше max_workers страниц: окно
+        запускается до того, как отдана первая страница, и пополняется по
+        мере того, как вызывающий код забирает страницы. Пока он обрабатывает
+        страницу k, следующие уже загружаются, а в памяти держится не больше
+        max_workers + 1 страниц.
+        """
+        connector = aiohttp.TCPConnector(limit=self.max_workers)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            first_page = await self._get_page_async(session, search_query, 0)
+            next_page = iter(range(1, first_page.get("pages", 1)))
+            window: "collections.deque[asyncio.Future]" = collections.deque()
+
+            def fill_window() -> None:
+                while len(window) < self.max_workers:
+                    page = next(next_page, None)
+                    if page is None:
+                        return
+                    window.append(asyncio.ensure_future(self._get_page_async(session, search_query, page)))
+
+            fill_window()
+            try:
+                yield first_page.get("items", [])
+                while window:
+                    data = await window.popleft()
+                    fill_window()
+                    yield data.get("items", [])
+            finally:
+                for task in window:
+                    task.cancel()
+
+    async def _get_page_async(
+        self, session: aiohttp.ClientSession, search_query: str, page: int
+    ) -> Dict[str, Any]:
+        """Асинхронно запрашивает одну страницу выдачи."""
+        async with session.get(self.base_url, params=self._page_params(search_query, page)) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    @staticmethod
+    def _page_params(search_query: str, page: int) -> Dict[str, Any]:
+        return {
             "text": search_query,
             "area": 113,  # Россия
             "per_page": 100,  # Количество вакансий на странице
+            "page": page,
         }
-        response = requests.get(self.base_url, params=params)
-        response.raise_for_status()
-        return response.json().get("items", [])
@@ -0,0 +1,51 @@
+"""Скомпилированные Numba-ядра для пакетного расчета зарплат.
+
+Модуль импортируется лениво, только когда нужны массивы зарплат, чтобы
+загрузка numba не замедляла импорт модели и запуск программы.
+"""
+from typing import Sequence, Tuple
+
+import numpy as np
+from numba import njit
+
+from .vacancy import Vacancy
+
+# Значение в массивах зарплат, означающее, что граница не указана.
+NO_SALARY = -1
+
+
+@njit(cache=True)
+def _batch_salary(sal_from: np.ndarray, sal_to: np.ndarray, out: np.ndarray) -> None:
+    """Записывает в out среднюю зарплату для каждой пары границ.
+
+    Пакетный аналог Vacancy.get_salary(): середина диапазона, если указаны
+    обе границы, иначе указанная граница, иначе 0. Отсутствующая граница
+    обозначается NO_SALARY.
+    """
+    for i in range(sal_from.shape[0]):
+        f = sal_from[i]
+        t = sal_to[i]
+        if f >= 0 and t >= 0:
+            out[i] = (f + t) // 2
+        elif f >= 0:
+            out[i] = f
+        elif t >= 0:
+            out[i] = t
+        else:
+            out[i] = 0
+
+
+def salary_arrays(vacancies: Sequence[Vacancy]) -> Tuple[np.ndarray, np.ndarray]:
+    """Собирает границы зарплат вакансий в массивы int64 для _batch_salary."""
+    count = len(vacancies)
+    sal_from = np.fromiter((v.salary_from or NO_SALARY for v in vacancies), dtype=np.int64, count=count)
+    sal_to = np.fromiter((v.salary_to or NO_SALARY for v in vacancies), dtype=np.int64, count=count)
+    return sal_from, sal_to
+
+
+def average_salaries(vacancies: Sequence[Vacancy]) -> np.ndarray:
+    """Возвращает массив средних зарплат вакансий, рассчитанный ядром _batch_salary."""
+    sal_from, sal_to = salary_arrays(vacancies)
+    out = np.empty(sal_from.shape[0], dtype=np.int64)
+    _batch_salary(sal_from, sal_to, out)
+    return out
@@ -1,9 +1,31 @@
 from typing import Dict, Any, Optional
 
 
+def _truncate_text(text: str, max_length: int) -> str:
+    """Обрезает текст до указанной длины."""
+    if len(text) <= max_length:
+        return text
+    return text[:max_length] + "..."
+
+
 class Vacancy:
     """Класс для представления вакансии."""
 
+    __slots__ = (
+        "title",
+        "link",
+        "salary",
+        "description",
+        "requirements",
+        "salary_from",
+        "salary_to",
+        "avg_salary",
+        "_title_lc",
+        "_desc_lc",
+        "_req_lc",
+        "_summary",
+    )
+
     def __init__(
             self,
             title: str,
@@ -17,6 +39,21 @@ class Vacancy:
         self.salary = salary
         self.description = description
         self.requirements = requirements
+        # Нижний регистр для поиска по ключевым словам считается один раз.
+        # hh.ru может вернуть null в этих полях, поэтому None считается пустой строкой.
+        self._title_lc = (title or "").lower()
+        self._desc_lc = (description or "").lower()
+        self._req_lc = (requirements or "").lower()
+        self._summary: Optional[str] = None
+        # Границы зарплаты хранятся плоскими числами (0 — не указана),
+        # а средняя считается один раз, чтобы сравнения и сортировка
+        # не разбирали словарь salary на каждом вызове.
+        self.salary_from = (salary.get("from") if salary else None) or 0
+        self.salary_to = (salary.get("to") if salary else None) or 0
+        if self.salary_from and self.salary_to:
+            self.avg_salary = (self.salary_from + self.salary_to) // 2
+        else:
+            self.avg_salary = self.salary_from or self.salary_to
 
     def __repr__(self):
         return (
@@ -26,44 +63,59 @@ class Vacancy:
         )
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, Vacancy):
             return False
-        return self.get_salary() == other.get_salary()
+        return self.avg_salary == other.avg_salary
 
     def __lt__(self, other):
+        if other is self:
+            return False
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary() < other.get_salary()
+        return self.avg_salary < other.avg_salary
 
     def __le__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary() <= other.get_salary()
+        return self.avg_salary <= other.avg_salary
 
     def __gt__(self, other):
+        if other is self:
+            return False
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary() > other.get_salary()
+        return self.avg_salary > other.avg_salary
 
     def __ge__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary() >= other.get_salary()
+        return self.avg_salary >= other.avg_salary
 
     def get_salary(self) -> int:
         """Возвращает среднюю зарплату или 0, если зарплата не указана."""
-        if not self.salary:
-            return 0
-        from_salary = self.salary.get("from")
-        to_salary = self.salary.get("to")
-        if from_salary and to_salary:
-            return (from_salary + to_salary) // 2
-        elif from_salary:
-            return from_salary
-        elif to_salary:
-            return to_salary
-        else:
-            return 0
+        return self.avg_salary
+
+    def format_summary(self) -> str:
+        """Возвращает текст вакансии для вывода пользователю.
+
+        Строка собирается при первом вызове и затем переиспользуется.
+        """
+        if self._summary is None:
+            salary_str = f"{self.avg_salary} RUB" if self.avg_salary else "Зарплата не указана"
+            self._summary = (
+                f"{self.title}\n"
+                f"   Ссылка: {self.link}\n"
+                f"   Зарплата: {salary_str}\n"
+                f"   Описание: {_truncate_text(self.description or '', 100)}\n"
+                f"   Требования: {_truncate_text(self.requirements or '', 100)}\n"
+            )
+        return self._summary
 
     def to_dict(self) -> Dict[str, Any]:
         """Преобразует объект Vacancy в словарь."""
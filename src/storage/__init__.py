@@ -3,6 +3,9 @@ from .json_storage import JSONVacancyStorage
 from .excel_storage import ExcelVacancyStorage
 from .csv_storage import CSVVacancyStorage
 from .txt_storage import TXTVacancyStorage
+from .parquet_storage import ParquetVacancyStorage
+from .sqlite_storage import SQLiteVacancyStorage
 
-__all__ = ['VacancyStorage', 'JSONVacancyStorage', 'ExcelVacancyStorage', 'CSVVacancyStorage', 'TXTVacancyStorage']
+__all__ = ['VacancyStorage', 'JSONVacancyStorage', 'ExcelVacancyStorage', 'CSVVacancyStorage', 'TXTVacancyStorage',
+           'ParquetVacancyStorage', 'SQLiteVacancyStorage']
 
@@ -1,16 +1,29 @@
 import abc
-from typing import List, Dict, Any
+import contextlib
+from typing import List, Dict, Any, Iterable, Iterator, Optional, IO
 from ..models import Vacancy
+from . import filters
+
+BUFFER_SIZE = 1 << 20
 
 
 class VacancyStorage(abc.ABC):
     """Абстрактный класс для работы с хранилищем вакансий."""
 
+    # True, если get_vacancies() фильтрует по индексам хранилища и выборку
+    # по критериям выгоднее делать в нем, а не в памяти.
+    indexed_filters = False
+
     @abc.abstractmethod
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """Добавляет вакансию в хранилище."""
         pass
 
+    @abc.abstractmethod
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        """Добавляет список вакансий в хранилище за одну операцию записи."""
+        pass
+
     @abc.abstractmethod
     def get_vacancies(self, criteria: Dict[str, Any]) -> List[Vacancy]:
         """Получает вакансии по критериям."""
@@ -21,49 +34,136 @@ class VacancyStorage(abc.ABC):
         """Удаляет вакансии по критериям."""
         pass
 
-    def _filter_vacancies(self, vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
-        """Базовая реализация фильтрации вакансий."""
-        if not criteria:
-            return vacancies
-
-        filtered = []
-        for vacancy in vacancies:
-            matches = True
-            for key, value in criteria.items():
-                if key == "keyword":
-                    keyword_lower = value.lower()
-                    title_match = keyword_lower in vacancy.title.lower()
-                    desc_match = keyword_lower in vacancy.description.lower()
-                    req_match = keyword_lower in vacancy.requirements.lower()
-
-                    if not (title_match or desc_match or req_match):
-                        matches = False
-                        break
-                elif key == "min_salary":
-                    if vacancy.get_salary() < value:
-                        matches = False
-                        break
-                elif getattr(vacancy, key, None) != value:
-                    matches = False
-                    break
-            if matches:
-                filtered.append(vacancy)
-        return filtered
+    @contextlib.contextmanager
+    def bulk_write(self) -> Iterator[Optional[IO[str]]]:
+        """Контекст пакетной записи.
+
+        Хранилища с дозаписью в файл держат его открытым на всё время
+        контекста. По умолчанию ничего не делает.
+        """
+        yield None
+
+    def filter_vacancies(self, vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
+        """Фильтрует вакансии по критериям.
+
+        Хранилище может переопределить метод, чтобы задать свои правила отбора.
+        """
+        return filters.filter_vacancies(vacancies, criteria)
 
     def _matches_criteria(self, vacancy: Vacancy, criteria: Dict[str, Any]) -> bool:
         """Проверяет, соответствует ли вакансия критериям."""
-        for key, value in criteria.items():
-            if key == "keyword":
-                keyword_lower = value.lower()
-                title_match = keyword_lower in vacancy.title.lower()
-                desc_match = keyword_lower in vacancy.description.lower()
-                req_match = keyword_lower in vacancy.requirements.lower()
-
-                if not (title_match or desc_match or req_match):
-                    return False
-            elif key == "min_salary":
-                if vacancy.get_salary() < value:
-                    return False
-            elif getattr(vacancy, key, None) != value:
-                return False
-        return True
+        return filters.matches_criteria(vacancy, criteria)
+
+    def _exclude_vacancies(self, vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
+        """Возвращает вакансии, не соответствующие критериям (для удаления)."""
+        return filters.exclude_vacancies(vacancies, criteria)
+
+
+class AppendFileMixin:
+    """Дозапись строк в текстовый файл хранилища.
+
+    На время bulk_write() файл держится открытым с большим буфером, вне
+    пакета каждая запись открывает его заново. Дополнительные аргументы
+    open() (например, newline) задаются в open_kwargs.
+    """
+
+    file_path: str
+    open_kwargs: Dict[str, Any] = {}
+    _fh: Optional[IO[str]] = None
+
+    def _open_file(self, mode: str) -> IO[str]:
+        return open(self.file_path, mode, encoding="utf-8", buffering=BUFFER_SIZE, **self.open_kwargs)
+
+    def open(self) -> None:
+        """Открывает файл для дозаписи и держит его открытым до close()."""
+        if self._fh is None:
+            self._fh = self._open_file("a")
+
+    def close(self) -> None:
+        """Сбрасывает буфер и закрывает удерживаемый файл."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    @contextlib.contextmanager
+    def bulk_write(self) -> Iterator[IO[str]]:
+        """Держит файл открытым, пока выполняется пакет записей."""
+        opened_here = self._fh is None
+        self.open()
+        try:
+            yield self._fh
+        finally:
+            if opened_here:
+                self.close()
+
+    def _write_lines(self, lines: Iterable[str]) -> None:
+        """Пишет строки в удерживаемый файл или открывает его на одну запись."""
+        if self._fh is not None:
+            self._fh.writelines(lines)
+            return
+        with self._open_file("a") as file:
+            file.writelines(lines)
+
+    def _flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+
+class WholeFileVacancyStorage(VacancyStorage):
+    """Хранилище, которое при каждом изменении перезаписывает файл целиком.
+
+    Наследники реализуют только _read_all() и _write_all(). Внутри
+    bulk_write() добавляемые вакансии копятся в памяти и сохраняются
+    одной записью при выходе из контекста.
+    """
+
+    _pending: Optional[List[Vacancy]] = None
+
+    @abc.abstractmethod
+    def _read_all(self) -> List[Vacancy]:
+        """Читает все вакансии из файла."""
+        pass
+
+    @abc.abstractmethod
+    def _write_all(self, vacancies: List[Vacancy]) -> None:
+        """Перезаписывает файл переданными вакансиями."""
+        pass
+
+    def _append_all(self, vacancies: List[Vacancy]) -> None:
+        """Дописывает вакансии к файлу. Наследник может сделать это быстрее."""
+        self._write_all(self._read_all() + list(vacancies))
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        if self._pending is not None:
+            self._pending.extend(vacancies)
+            return
+        self._append_all(vacancies)
+
+    @contextlib.contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """Копит добавляемые вакансии и записывает файл один раз при выходе."""
+        if self._pending is not None:
+            yield None
+            return
+        self._pending = []
+        try:
+            yield None
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._append_all(pending)
+
+    def get_vacancies(self, criteria: Dict[str, Any]) -> List[Vacancy]:
+        vacancies = self._read_all()
+        if self._pending:
+            vacancies.extend(self._pending)
+        return self.filter_vacancies(vacancies, criteria)
+
+    def delete_vacancy(self, criteria: Dict[str, Any]) -> None:
+        vacancies = self._exclude_vacancies(self.get_vacancies({}), criteria)
+        if self._pending:
+            self._pending.clear()
+        self._write_all(vacancies)
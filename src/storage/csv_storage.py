@@ -1,13 +1,42 @@
 import csv
 import json
-from typing import List, Dict, Any
-from .base import VacancyStorage
+from typing import List, Dict, Any, Optional
+from .base import AppendFileMixin, VacancyStorage
 from ..models import Vacancy
 
+HEADER = ["title", "link", "salary", "description", "requirements"]
+_SPECIAL_CHARS = frozenset(',"\r\n')
 
-class CSVVacancyStorage(VacancyStorage):
+
+def _escape(value: Optional[str]) -> str:
+    """Экранирует значение так же, как csv.writer с QUOTE_MINIMAL (None — пустое поле)."""
+    if value is None:
+        return ""
+    if _SPECIAL_CHARS.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _format_row(fields: List[str]) -> str:
+    """Формирует готовую строку CSV, минуя csv.writer."""
+    return ",".join(map(_escape, fields)) + "\r\n"
+
+
+def _vacancy_row(vacancy: Vacancy) -> str:
+    return _format_row([
+        vacancy.title,
+        vacancy.link,
+        json.dumps(vacancy.salary) if vacancy.salary else "",
+        vacancy.description,
+        vacancy.requirements,
+    ])
+
+
+class CSVVacancyStorage(AppendFileMixin, VacancyStorage):
     """Класс для сохранения вакансий в CSV-файл."""
 
+    open_kwargs = {"newline": ""}
+
     def __init__(self, file_path: str):
         self.file_path = file_path
         self._ensure_file_exists()
@@ -22,92 +51,44 @@ class CSVVacancyStorage(VacancyStorage):
                 pass
         except FileNotFoundError:
             with open(self.file_path, "w", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-                writer.writerow(["title", "link", "salary", "description", "requirements"])
+                file.write(_format_row(HEADER))
         except Exception as e:
             print(f"Ошибка при создании файла {self.file_path}: {e}")
 
     def add_vacancy(self, vacancy: Vacancy) -> None:
-        with open(self.file_path, "a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                vacancy.title,
-                vacancy.link,
-                json.dumps(vacancy.salary) if vacancy.salary else "",
-                vacancy.description,
-                vacancy.requirements,
-            ])
+        self._write_lines([_vacancy_row(vacancy)])
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        self._write_lines(map(_vacancy_row, vacancies))
 
     def get_vacancies(self, criteria: Dict[str, Any]) -> List[Vacancy]:
+        self._flush()
         vacancies = []
-        with open(self.file_path, "r", newline="", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
+        with self._open_file("r") as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Пропускаем заголовок
             for row in reader:
-                salary = json.loads(row["salary"]) if row["salary"] else None
+                if len(row) != 5:
+                    continue
+                title, link, salary_str, description, requirements = row
+                salary = json.loads(salary_str) if salary_str else None
                 vacancy = Vacancy(
-                    title=row["title"],
-                    link=row["link"],
+                    title=title,
+                    link=link,
                     salary=salary,
-                    description=row["description"],
-                    requirements=row["requirements"],
+                    description=description,
+                    requirements=requirements,
                 )
                 vacancies.append(vacancy)
-        return self._filter_vacancies(vacancies, criteria)
+        return self.filter_vacancies(vacancies, criteria)
 
     def delete_vacancy(self, criteria: Dict[str, Any]) -> None:
         vacancies = self.get_vacancies({})
-        filtered_vacancies = [v for v in vacancies if not self._matches_criteria(v, criteria)]
+        filtered_vacancies = self._exclude_vacancies(vacancies, criteria)
         self._save_all_vacancies(filtered_vacancies)
 
     def _save_all_vacancies(self, vacancies: List[Vacancy]) -> None:
-        with open(self.file_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(["title", "link", "salary", "description", "requirements"])
-            for vacancy in vacancies:
-                writer.writerow([
-                    vacancy.title,
-                    vacancy.link,
-                    json.dumps(vacancy.salary) if vacancy.salary else "",
-                    vacancy.description,
-                    vacancy.requirements,
-                ])
-
-    def _filter_vacancies(
-        self, vacancies: List[Vacancy], criteria: Dict[str, Any]
-    ) -> List[Vacancy]:
-        filtered = []
-        for vacancy in vacancies:
-            matches = True
-            for key, value in criteria.items():
-                if key == "keyword":
-                    if value.lower() not in vacancy.description.lower() and value.lower() not in vacancy.requirements.lower():
-                        matches = False
-                        break
-                elif key == "min_salary":
-                    if vacancy.get_salary() < value:
-                        matches = False
-                        break
-                elif getattr(vacancy, key, None) != value:
-                    matches = False
-                    break
-            if matches:
-                filtered.append(vacancy)
-        return filtered
-
-    def _matches_criteria(self, vacancy_data: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
-        for key, value in criteria.items():
-            if key == "keyword":
-                description = vacancy_data.get("description", "").lower()
-                requirements = vacancy_data.get("requirements", "").lower()
-                title = vacancy_data.get("title", "").lower()
-                if (value.lower() not in description and
-                        value.lower() not in requirements and
-                        value.lower() not in title):
-                    return False
-            elif key == "min_salary":
-                vacancy = Vacancy.validate_and_create(vacancy_data)
-                if vacancy.get_salary() < value:
-                    return False
-            elif getattr(vacancy_data, key, None) != value:
-                return False
-        return True
\ No newline at end of file
+        self._flush()
+        with self._open_file("w") as file:
+            file.write(_format_row(HEADER))
+            file.writelines(map(_vacancy_row, vacancies))
@@ -0,0 +1,72 @@
+import re
+from typing import List, Dict, Any, Callable, Iterable
+from ..models import Vacancy
+
+Predicate = Callable[[Vacancy], bool]
+
+
+def _compile_keywords(keywords: Iterable[str]) -> Predicate:
+    """Строит проверку «есть хотя бы одно из ключевых слов».
+
+    Все слова собираются в одно регулярное выражение, поэтому текст
+    каждой вакансии просматривается один раз независимо от числа слов.
+    """
+    keywords = [keyword.lower() for keyword in keywords]
+    if not keywords:
+        return lambda vacancy: True
+    search = re.compile("|".join(map(re.escape, keywords))).search
+    return lambda vacancy: (
+        search(vacancy._title_lc) is not None
+        or search(vacancy._desc_lc) is not None
+        or search(vacancy._req_lc) is not None
+    )
+
+
+def _compile_criterion(key: str, value: Any) -> Predicate:
+    """Строит проверку для одного критерия."""
+    if key == "keyword":
+        if not isinstance(value, str):
+            return _compile_keywords(value)
+        keyword_lower = value.lower()
+        return lambda vacancy: (
+            keyword_lower in vacancy._title_lc
+            or keyword_lower in vacancy._desc_lc
+            or keyword_lower in vacancy._req_lc
+        )
+    if key == "min_salary":
+        return lambda vacancy: vacancy.avg_salary >= value
+    return lambda vacancy: getattr(vacancy, key, None) == value
+
+
+def compile_criteria(criteria: Dict[str, Any]) -> Predicate:
+    """Компилирует критерии в одну функцию-проверку вакансии.
+
+    Поддерживаемые критерии: "keyword" — подстрока в названии, описании
+    или требованиях без учета регистра (или список подстрок, из которых
+    должна найтись хотя бы одна), "min_salary" — нижняя граница средней зарплаты,
+    любое другое имя — точное совпадение с одноименным атрибутом вакансии.
+    Разбор критериев выполняется один раз, а не для каждой вакансии.
+    """
+    predicates = [_compile_criterion(key, value) for key, value in criteria.items()]
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda vacancy: all(predicate(vacancy) for predicate in predicates)
+
+
+def matches_criteria(vacancy: Vacancy, criteria: Dict[str, Any]) -> bool:
+    """Проверяет, соответствует ли вакансия критериям."""
+    return compile_criteria(criteria)(vacancy)
+
+
+def filter_vacancies(vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
+    """Возвращает вакансии, соответствующие критериям."""
+    if not criteria:
+        return vacancies
+    predicate = compile_criteria(criteria)
+    return [vacancy for vacancy in vacancies if predicate(vacancy)]
+
+
+def exclude_vacancies(vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
+    """Возвращает вакансии, которые не соответствуют критериям."""
+    predicate = compile_criteria(criteria)
+    return [vacancy for vacancy in vacancies if not predicate(vacancy)]
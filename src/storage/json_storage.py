@@ -1,75 +1,92 @@
-import json
 import os
 from typing import List, Dict, Any
+
+import orjson
+
 from .base import VacancyStorage
 from ..models import Vacancy
 
 
 class JSONVacancyStorage(VacancyStorage):
-    """Класс для сохранения вакансий в JSON-файл."""
+    """Класс для сохранения вакансий в JSON-файл.
+
+    Файл хранится в формате JSON Lines: одна вакансия — одна строка,
+    поэтому добавление дописывает строки в конец, не перезаписывая файл.
+    """
 
     def __init__(self, file_path: str):
         self.file_path = file_path
         self._ensure_file_exists()
 
     def _ensure_file_exists(self) -> None:
-        """Создает файл, если он не существует."""
+        """Создает файл, если он не существует, и переводит старый формат в JSON Lines."""
         try:
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            with open(self.file_path, "r", encoding="utf-8") as file:
-                pass
+            with open(self.file_path, "rb") as file:
+                is_legacy = file.read(64).lstrip().startswith(b"[")
+            if is_legacy:
+                self._migrate_legacy_file()
         except FileNotFoundError:
-            with open(self.file_path, "w", encoding="utf-8") as file:
-                json.dump([], file)
+            with open(self.file_path, "wb"):
+                pass
         except Exception as e:
             print(f"Ошибка при создании файла {self.file_path}: {e}")
 
+    def _migrate_legacy_file(self) -> None:
+        """Переписывает файл с JSON-массивом в формат JSON Lines."""
+        with open(self.file_path, "rb") as file:
+            try:
+                data = orjson.loads(file.read())
+            except orjson.JSONDecodeError:
+                return
+        if isinstance(data, list):
+            self._save_vacancies(data)
+
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """Добавляет вакансию в JSON файл."""
-        vacancies = self._load_vacancies()
-        if not isinstance(vacancies, list):
-            vacancies = []
-        vacancies.append(vacancy.to_dict())
-        self._save_vacancies(vacancies)
+        self._append_vacancies([vacancy.to_dict()])
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        """Дописывает список вакансий в JSON файл."""
+        self._append_vacancies([vacancy.to_dict() for vacancy in vacancies])
 
     def get_vacancies(self, criteria: Dict[str, Any]) -> List[Vacancy]:
         """Получает вакансии из JSON файла по критериям."""
-        vacancies_data = self._load_vacancies()
-        if not isinstance(vacancies_data, list):
-            vacancies_data = []
-        vacancies = [Vacancy.validate_and_create(data) for data in vacancies_data]
-        return self._filter_vacancies(vacancies, criteria)
+        vacancies = [Vacancy.validate_and_create(data) for data in self._load_vacancies()]
+        return self.filter_vacancies(vacancies, criteria)
 
     def delete_vacancy(self, criteria: Dict[str, Any]) -> None:
         """Удаляет вакансии из JSON файла по критериям."""
-        vacancies_data = self._load_vacancies()
-        if not isinstance(vacancies_data, list):
-            vacancies_data = []
-        vacancies = [Vacancy.validate_and_create(data) for data in vacancies_data]
-        filtered_vacancies = [
-            v for v in vacancies if not self._matches_criteria(v, criteria)
-        ]
+        vacancies = [Vacancy.validate_and_create(data) for data in self._load_vacancies()]
+        filtered_vacancies = self._exclude_vacancies(vacancies, criteria)
         self._save_vacancies([v.to_dict() for v in filtered_vacancies])
 
     def _load_vacancies(self) -> List[Dict[str, Any]]:
-        """Загружает вакансии из JSON файла."""
+        """Загружает вакансии из JSON файла построчно."""
         try:
-            with open(self.file_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                if isinstance(data, list):
-                    return data
-                else:
-                    print(f"Предупреждение: файл {self.file_path} содержит некорректные данные.")
-                    return []
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.file_path, "rb") as file:
+                data = [orjson.loads(line) for line in file if line.strip()]
+        except (FileNotFoundError, orjson.JSONDecodeError):
             print(f"Файл {self.file_path} не найден или поврежден. Создается новый файл.")
             return []
+        if not all(isinstance(item, dict) for item in data):
+            print(f"Предупреждение: файл {self.file_path} содержит некорректные данные.")
+            return []
+        return data
+
+    def _append_vacancies(self, vacancies: List[Dict[str, Any]]) -> None:
+        """Дописывает вакансии в конец JSON файла."""
+        try:
+            with open(self.file_path, "ab") as file:
+                file.writelines(orjson.dumps(vacancy) + b"\n" for vacancy in vacancies)
+        except Exception as e:
+            print(f"Ошибка при сохранении файла {self.file_path}: {e}")
 
     def _save_vacancies(self, vacancies: List[Dict[str, Any]]) -> None:
-        """Сохраняет вакансии в JSON файл."""
+        """Перезаписывает JSON файл целиком."""
         try:
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            with open(self.file_path, "w", encoding="utf-8") as file:
-                json.dump(vacancies, file, ensure_ascii=False, indent=4)
+            with open(self.file_path, "wb") as file:
+                file.writelines(orjson.dumps(vacancy) + b"\n" for vacancy in vacancies)
         except Exception as e:
             print(f"Ошибка при сохранении файла {self.file_path}: {e}")
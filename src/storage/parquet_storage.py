@@ -0,0 +1,86 @@
+import json
+import os
+from typing import List, Dict, Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .base import WholeFileVacancyStorage
+from ..models import Vacancy
+
+SCHEMA = pa.schema([
+    ("title", pa.string()),
+    ("link", pa.string()),
+    ("salary", pa.string()),
+    ("salary_from", pa.int64()),
+    ("salary_to", pa.int64()),
+    ("description", pa.string()),
+    ("requirements", pa.string()),
+])
+
+
+class ParquetVacancyStorage(WholeFileVacancyStorage):
+    """Класс для сохранения вакансий в Parquet-файл."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._ensure_file_exists()
+
+    def _ensure_file_exists(self) -> None:
+        """Создает пустой файл с нужной схемой, если он не существует."""
+        if os.path.exists(self.file_path):
+            return
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            self._write_table(SCHEMA.empty_table())
+        except Exception as e:
+            print(f"Ошибка при создании файла {self.file_path}: {e}")
+
+    def _read_all(self) -> List[Vacancy]:
+        return [self._from_row(row) for row in self._read_table().to_pylist()]
+
+    def _write_all(self, vacancies: List[Vacancy]) -> None:
+        self._write_table(self._to_table(vacancies))
+
+    def _append_all(self, vacancies: List[Vacancy]) -> None:
+        """Дописывает вакансии к таблице без разбора уже сохраненных строк."""
+        table = pa.concat_tables([self._read_table(), self._to_table(vacancies)])
+        self._write_table(table)
+
+    def _read_table(self) -> pa.Table:
+        """Читает таблицу из файла одной колоночной операцией."""
+        try:
+            return pq.read_table(self.file_path, schema=SCHEMA)
+        except FileNotFoundError:
+            return SCHEMA.empty_table()
+
+    def _write_table(self, table: pa.Table) -> None:
+        pq.write_table(table, self.file_path, compression="zstd")
+
+    @staticmethod
+    def _to_table(vacancies: List[Vacancy]) -> pa.Table:
+        """Преобразует список вакансий в таблицу pyarrow."""
+        salaries = [vacancy.salary or {} for vacancy in vacancies]
+        return pa.Table.from_pydict(
+            {
+                "title": [vacancy.title for vacancy in vacancies],
+                "link": [vacancy.link for vacancy in vacancies],
+                "salary": [json.dumps(vacancy.salary) if vacancy.salary else None for vacancy in vacancies],
+                "salary_from": [salary.get("from") for salary in salaries],
+                "salary_to": [salary.get("to") for salary in salaries],
+                "description": [vacancy.description for vacancy in vacancies],
+                "requirements": [vacancy.requirements for vacancy in vacancies],
+            },
+            schema=SCHEMA,
+        )
+
+    @staticmethod
+    def _from_row(row: Dict[str, Any]) -> Vacancy:
+        """Создает вакансию из строки таблицы."""
+        return Vacancy(
+            title=row["title"],
+            link=row["link"],
+            salary=json.loads(row["salary"]) if row["salary"] else None,
+            description=row["description"] or "",
+            requirements=row["requirements"] or "",
+        )
@@ -0,0 +1,154 @@
+import json
+import os
+import sqlite3
+from typing import List, Dict, Any, Optional, Tuple
+
+from .base import VacancyStorage
+from .filters import compile_criteria
+from ..models import Vacancy
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    link TEXT,
+    salary TEXT,
+    salary_from INTEGER,
+    salary_to INTEGER,
+    avg_salary INTEGER,
+    description TEXT,
+    requirements TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_salary ON vacancies(avg_salary);
+CREATE VIRTUAL TABLE IF NOT EXISTS v_fts USING fts5(
+    title, description, requirements, content='vacancies', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+    INSERT INTO v_fts(rowid, title, description, requirements)
+    VALUES (new.id, new.title, new.description, new.requirements);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+    INSERT INTO v_fts(v_fts, rowid, title, description, requirements)
+    VALUES ('delete', old.id, old.title, old.description, old.requirements);
+END;
+"""
+
+# Атрибуты вакансии, которые можно сравнивать на равенство прямо в SQL.
+_COLUMNS = {"title", "link", "salary_from", "salary_to", "avg_salary", "description", "requirements"}
+# Триграммный индекс находит только подстроки длиной от трех символов.
+_MIN_FTS_KEYWORD = 3
+
+
+def _fts_phrase(keyword: str) -> str:
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class SQLiteVacancyStorage(VacancyStorage):
+    """Класс для хранения вакансий в базе SQLite.
+
+    Фильтр min_salary выполняется по индексу avg_salary, поиск по ключевому
+    слову — по полнотекстовому индексу FTS5 над названием, описанием и требованиями.
+    """
+
+    indexed_filters = True
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        # Запись может выполняться из рабочего потока (asyncio.to_thread),
+        # обращения к соединению при этом идут последовательно.
+        self._conn = sqlite3.connect(self.file_path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Закрывает соединение с базой."""
+        self._conn.close()
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO vacancies "
+                "(title, link, salary, salary_from, salary_to, avg_salary, description, requirements) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        vacancy.title,
+                        vacancy.link,
+                        json.dumps(vacancy.salary) if vacancy.salary else None,
+                        vacancy.salary_from,
+                        vacancy.salary_to,
+                        vacancy.avg_salary,
+                        vacancy.description or "",
+                        vacancy.requirements or "",
+                    )
+                    for vacancy in vacancies
+                ],
+            )
+
+    def get_vacancies(self, criteria: Dict[str, Any]) -> List[Vacancy]:
+        return [vacancy for _, vacancy in self._select(criteria)]
+
+    def delete_vacancy(self, criteria: Dict[str, Any]) -> None:
+        ids = [(row_id,) for row_id, _ in self._select(criteria)]
+        with self._conn:
+            self._conn.executemany("DELETE FROM vacancies WHERE id = ?", ids)
+
+    def _select(self, criteria: Dict[str, Any]) -> List[Tuple[int, Vacancy]]:
+        """Выбирает вакансии по критериям вместе с их id.
+
+        Все критерии, которые можно выразить в SQL, отбирают кандидатов в
+        базе. Затем общий фильтр проверяет кандидатов по всем критериям,
+        поэтому результат совпадает с остальными хранилищами.
+        """
+        where, params = self._build_where(criteria)
+        query = "SELECT id, title, link, salary, description, requirements FROM vacancies"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY id"
+        rows = [
+            (
+                row_id,
+                Vacancy(
+                    title=title,
+                    link=link,
+                    salary=json.loads(salary) if salary else None,
+                    description=description,
+                    requirements=requirements,
+                ),
+            )
+            for row_id, title, link, salary, description, requirements in self._conn.execute(query, params)
+        ]
+        if not criteria:
+            return rows
+        predicate = compile_criteria(criteria)
+        return [(row_id, vacancy) for row_id, vacancy in rows if predicate(vacancy)]
+
+    @classmethod
+    def _build_where(cls, criteria: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        """Переводит поддерживаемые критерии в условия WHERE."""
+        where: List[str] = []
+        params: List[Any] = []
+        for key, value in criteria.items():
+            if key == "keyword":
+                match = cls._fts_query(value)
+                if match is not None:
+                    where.append("id IN (SELECT rowid FROM v_fts WHERE v_fts MATCH ?)")
+                    params.append(match)
+            elif key == "min_salary":
+                where.append("avg_salary >= ?")
+                params.append(value)
+            elif key in _COLUMNS:
+                where.append(f"{key} = ?")
+                params.append(value)
+        return where, params
+
+    @staticmethod
+    def _fts_query(value: Any) -> Optional[str]:
+        """Строит запрос MATCH или возвращает None, если индекс неприменим."""
+        keywords = [value] if isinstance(value, str) else list(value)
+        if not keywords or any(len(keyword) < _MIN_FTS_KEYWORD for keyword in keywords):
+            return None
+        return " OR ".join(map(_fts_phrase, keywords))
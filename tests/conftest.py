@@ -1,4 +1,65 @@
 import sys
 import os
+import types
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
\ No newline at end of file
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+
+@pytest.fixture(scope="module")
+def valid_vacancy_payload():
+    return types.MappingProxyType({
+        "name": "Backend Developer",
+        "alternate_url": "https://example.com",
+        "salary": {"from": 100000, "to": 150000},
+        "description": "Great job opportunity",
+        "snippet": {"requirement": "Experience with Django"},
+    })
+
+
+@pytest.fixture(scope="module")
+def bad_salary_payload():
+    return types.MappingProxyType({
+        "name": "Broken Vacancy",
+        "alternate_url": "http://example.com",
+        "salary": "100000",  # Некорректный тип (строка вместо словаря)
+        "description": "Bad data",
+        "snippet": {"requirement": "None"},
+    })
+
+
+@pytest.fixture(scope="module")
+def minimal_payload():
+    return types.MappingProxyType({
+        "name": "No Salary",
+        "alternate_url": "http://example.com",
+        "description": "No salary provided",
+        "snippet": {"requirement": ""},
+    })
+
+
+def _freeze(value):
+    """Приводит аргументы вакансии к хешируемому виду для ключа кэша."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def vacancy_factory():
+    """Создает вакансии, переиспользуя экземпляры с одинаковыми аргументами."""
+    from src.models import Vacancy
+
+    cache = {}
+
+    def make(*args, **kwargs):
+        key = (_freeze(args), _freeze(kwargs))
+        vacancy = cache.get(key)
+        if vacancy is None:
+            vacancy = cache.setdefault(key, Vacancy(*args, **kwargs))
+        return vacancy
+
+    return make
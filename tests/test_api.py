@@ -1,24 +1,33 @@
+import asyncio
+
 from src.api.hh_api import HHVacancyAPI
 
-def test_hh_api_get_vacancies(mocker):
-    mock_response = mocker.Mock()
-    mock_response.json.return_value = {
-        "items": [
-            {
-                "name": "Mock Dev",
-                "alternate_url": "http://example.com",
-                "salary": {"from": 100000, "to": 150000},
-                "description": "Test desc",
-                "snippet": {"requirement": "Mock framework"}
-            }
-        ]
-    }
-    mock_response.raise_for_status = mocker.Mock()
-
-    # Мокаем requests.get
-    mocker.patch("src.api.hh_api.requests.get", return_value=mock_response)
+def _patch_pages(mocker, api, pages=1):
+    async def fake_page(session, search_query, page):
+        return {"items": [{"name": f"{search_query} {page}"}], "pages": pages}
+
+    return mocker.patch.object(api, "_get_page_async", side_effect=fake_page)
 
+
+def test_hh_api_get_vacancies(mocker):
     api = HHVacancyAPI()
+
+    async def fake_page(session, search_query, page):
+        return {
+            "items": [
+                {
+                    "name": "Mock Dev",
+                    "alternate_url": "http://example.com",
+                    "salary": {"from": 100000, "to": 150000},
+                    "description": "Test desc",
+                    "snippet": {"requirement": "Mock framework"}
+                }
+            ],
+            "pages": 1,
+        }
+
+    mocker.patch.object(api, "_get_page_async", side_effect=fake_page)
+
     results = api.get_vacancies("Python")
 
     assert isinstance(results, list)
@@ -27,12 +36,112 @@ def test_hh_api_get_vacancies(mocker):
 
 
 def test_hh_api_request_params(mocker):
-    mock_get = mocker.patch("src.api.hh_api.requests.get")
     api = HHVacancyAPI()
+    mock_page = _patch_pages(mocker, api)
     api.get_vacancies("Python")
 
-    mock_get.assert_called_once()
-    args, kwargs = mock_get.call_args
-    assert kwargs["params"]["text"] == "Python"
-    assert kwargs["params"]["area"] == 113
-    assert kwargs["params"]["per_page"] == 100
\ No newline at end of file
+    mock_page.assert_called_once()
+    args, kwargs = mock_page.call_args
+    assert args[1:] == ("Python", 0)
+
+    params = api._page_params("Python", 0)
+    assert params["text"] == "Python"
+    assert params["area"] == 113
+    assert params["per_page"] == 100
+    assert params["page"] == 0
+
+
+def test_hh_api_fetches_all_pages(mocker):
+    api = HHVacancyAPI()
+    mock_page = _patch_pages(mocker, api, pages=3)
+    results = api.get_vacancies("Dev")
+
+    assert mock_page.call_count == 3
+    assert [item["name"] for item in results] == ["Dev 0", "Dev 1", "Dev 2"]
+
+
+def test_hh_api_caches_responses_by_query(mocker):
+    api = HHVacancyAPI()
+    mock_page = _patch_pages(mocker, api)
+
+    first = api.get_vacancies("Python")
+    first[0]["name"] = "Changed"
+    second = api.get_vacancies("Python")
+    assert mock_page.call_count == 1
+    assert second[0]["name"] == "Python 0"
+
+    api.get_vacancies("Java")
+    assert mock_page.call_count == 2
+
+    api.clear_cache()
+    api.get_vacancies("Python")
+    assert mock_page.call_count == 3
+
+
+def test_hh_api_iter_vacancies_uses_cache(mocker):
+    api = HHVacancyAPI()
+    mock_page = _patch_pages(mocker, api, pages=3)
+
+    async def first_page():
+        async for page in api.iter_vacancies("Dev"):
+            return page
+
+    async def collect():
+        return [page async for page in api.iter_vacancies("Dev")]
+
+    # Незавершенная загрузка не попадает в кэш
+    asyncio.run(first_page())
+    assert asyncio.run(collect()) == [[{"name": "Dev 0"}], [{"name": "Dev 1"}], [{"name": "Dev 2"}]]
+    calls = mock_page.call_count
+    assert asyncio.run(collect()) == [[{"name": "Dev 0"}], [{"name": "Dev 1"}], [{"name": "Dev 2"}]]
+    assert api.get_vacancies("Dev") == [{"name": "Dev 0"}, {"name": "Dev 1"}, {"name": "Dev 2"}]
+    assert mock_page.call_count == calls
+
+
+def test_hh_api_iter_vacancies_bounds_pages_in_flight(mocker):
+    api = HHVacancyAPI()
+    api.max_workers = 3
+    started = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_page(session, search_query, page):
+        nonlocal in_flight, peak
+        started.append(page)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"items": [{"name": f"Dev {page}"}], "pages": 20}
+
+    mocker.patch.object(api, "_get_page_async", side_effect=fake_page)
+
+    async def collect():
+        pages = []
+        async for page in api.iter_vacancies("Python"):
+            if not pages:
+                # Пока обрабатывается первая страница, окно уже загружается
+                await asyncio.sleep(0.01)
+                assert started == [0, 1, 2, 3]
+            pages.append(page)
+        return pages
+
+    pages = asyncio.run(collect())
+    assert len(pages) == 20
+    assert peak <= api.max_workers
+    assert [page[0]["name"] for page in pages] == [f"Dev {page}" for page in range(20)]
+
+
+def test_hh_api_iter_vacancies_yields_pages_in_order(mocker):
+    async def fake_page(session, search_query, page):
+        return {"items": [{"name": f"Dev {page}"}], "pages": 3}
+
+    api = HHVacancyAPI()
+    mock_page = mocker.patch.object(api, "_get_page_async", side_effect=fake_page)
+
+    async def collect():
+        return [page async for page in api.iter_vacancies("Python")]
+
+    pages = asyncio.run(collect())
+    assert mock_page.call_count == 3
+    assert [[item["name"] for item in page] for page in pages] == [["Dev 0"], ["Dev 1"], ["Dev 2"]]
@@ -35,4 +35,68 @@ def test_csv_delete_vacancy(tmp_path):
     storage.add_vacancy(v)
     storage.delete_vacancy({"title": "Dev"})
     result = storage.get_vacancies({})
-    assert len(result) == 0
\ No newline at end of file
+    assert len(result) == 0
+
+def test_csv_add_vacancies(tmp_path):
+    file_path = tmp_path / "vac.csv"
+    storage = CSVVacancyStorage(str(file_path))
+
+    storage.add_vacancies([
+        Vacancy("Dev1", "url1", {"from": 100000}, "desc", "req"),
+        Vacancy("Dev2", "url2", None, "desc", "req"),
+    ])
+    result = storage.get_vacancies({})
+    assert [v.title for v in result] == ["Dev1", "Dev2"]
+    assert result[1].salary is None
+
+
+def test_csv_writer_matches_csv_module(tmp_path):
+    file_path = tmp_path / "vac.csv"
+    storage = CSVVacancyStorage(str(file_path))
+    v = Vacancy('Dev, "Senior"', "url", {"from": 100000, "to": 150000}, "line1\nline2", "")
+    storage.add_vacancies([v])
+
+    with open(file_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[1] == ['Dev, "Senior"', "url", json.dumps(v.salary), "line1\nline2", ""]
+
+    result = storage.get_vacancies({})
+    assert result[0].title == 'Dev, "Senior"'
+    assert result[0].description == "line1\nline2"
+
+
+def test_csv_bulk_write_keeps_file_open(tmp_path):
+    file_path = tmp_path / "vac.csv"
+    storage = CSVVacancyStorage(str(file_path))
+
+    with storage.bulk_write() as handle:
+        storage.add_vacancy(Vacancy("Dev1", "url1", None, "desc", "req"))
+        storage.add_vacancy(Vacancy("Dev2", "url2", None, "desc", "req"))
+        assert storage._fh is handle
+        assert len(storage.get_vacancies({})) == 2
+    assert handle.closed
+    assert storage._fh is None
+    assert [v.title for v in storage.get_vacancies({})] == ["Dev1", "Dev2"]
+
+
+def test_csv_filter_keyword_case_insensitive(tmp_path):
+    file_path = tmp_path / "vac.csv"
+    storage = CSVVacancyStorage(str(file_path))
+    storage.add_vacancies([
+        Vacancy("Dev1", "url1", None, "Python backend", "req"),
+        Vacancy("Dev2", "url2", None, "desc", "Знание PYTHON"),
+        Vacancy("Dev3", "url3", None, "Java backend", "Spring"),
+    ])
+
+    result = storage.get_vacancies({"keyword": "python"})
+    assert [v.title for v in result] == ["Dev1", "Dev2"]
+
+
+def test_csv_writes_missing_text_as_empty(tmp_path):
+    file_path = tmp_path / "vac.csv"
+    storage = CSVVacancyStorage(str(file_path))
+    storage.add_vacancy(Vacancy("Dev", "url", None, None, None))
+
+    result = storage.get_vacancies({})
+    assert result[0].description == ""
+    assert result[0].requirements == ""
@@ -32,4 +32,13 @@ def test_excel_delete_vacancy(tmp_path):
     v = Vacancy("X", "url", {"from": 100000}, "desc", "req")
     storage.add_vacancy(v)
     storage.delete_vacancy({"title": "X"})
-    assert storage.get_vacancies({}) == []
\ No newline at end of file
+    assert storage.get_vacancies({}) == []
+
+def test_excel_add_vacancies(tmp_path):
+    file_path = tmp_path / "vac.xlsx"
+    storage = ExcelVacancyStorage(str(file_path))
+    storage.add_vacancies([
+        Vacancy("A", "url", {"from": 100000}, "desc", "req"),
+        Vacancy("B", "url", {"from": 40000}, "desc", "req"),
+    ])
+    assert [v.title for v in storage.get_vacancies({})] == ["A", "B"]
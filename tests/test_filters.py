@@ -0,0 +1,57 @@
+from src.models import Vacancy
+from src.storage.filters import compile_criteria, exclude_vacancies, filter_vacancies, matches_criteria
+
+
+def _vacancies():
+    return [
+        Vacancy("Python Dev", "link1", {"from": 100000}, "Python backend", "Django"),
+        Vacancy("Java Dev", "link2", {"from": 150000}, "Java backend", "Spring"),
+        Vacancy("Data Engineer", "link3", None, "ETL pipelines", "Знание PYTHON"),
+    ]
+
+
+def test_filter_vacancies_without_criteria():
+    vacancies = _vacancies()
+    assert filter_vacancies(vacancies, {}) == vacancies
+
+
+def test_filter_vacancies_by_keyword_and_salary():
+    vacancies = _vacancies()
+    assert [v.title for v in filter_vacancies(vacancies, {"keyword": "python"})] == ["Python Dev", "Data Engineer"]
+    assert [v.title for v in filter_vacancies(vacancies, {"keyword": "python", "min_salary": 50000})] == ["Python Dev"]
+
+
+def test_filter_vacancies_by_attribute():
+    vacancies = _vacancies()
+    assert [v.title for v in filter_vacancies(vacancies, {"link": "link2"})] == ["Java Dev"]
+
+
+def test_matches_criteria():
+    vacancy = _vacancies()[0]
+    assert matches_criteria(vacancy, {"keyword": "DJANGO"})
+    assert not matches_criteria(vacancy, {"min_salary": 200000})
+    assert not matches_criteria(vacancy, {"title": "Other"})
+
+
+def test_compile_criteria_and_exclude():
+    vacancies = _vacancies()
+    predicate = compile_criteria({"keyword": "backend", "min_salary": 120000})
+    assert [v.title for v in vacancies if predicate(v)] == ["Java Dev"]
+    assert [v.title for v in exclude_vacancies(vacancies, {"keyword": "backend"})] == ["Data Engineer"]
+    assert exclude_vacancies(vacancies, {}) == []
+
+
+def test_filter_vacancies_by_several_keywords():
+    vacancies = _vacancies()
+    result = filter_vacancies(vacancies, {"keyword": ["SPRING", "etl", "c++"]})
+    assert [v.title for v in result] == ["Java Dev", "Data Engineer"]
+    assert filter_vacancies(vacancies, {"keyword": []}) == vacancies
+
+
+def test_filter_vacancies_by_keyword_in_title():
+    vacancies = [
+        Vacancy("Frontend Developer", "link1", None, None, "Опыт от 3 лет"),
+        Vacancy("Backend Developer", "link2", None, None, "Опыт от 3 лет"),
+    ]
+    assert [v.title for v in filter_vacancies(vacancies, {"keyword": "FRONTEND"})] == ["Frontend Developer"]
+    assert [v.title for v in filter_vacancies(vacancies, {"keyword": ["frontend", "c++"]})] == ["Frontend Developer"]
@@ -68,3 +68,39 @@ def test_json_storage_delete_vacancy(tmp_path):
     results = storage.get_vacancies({})
     assert len(results) == 1
     assert results[0].title == "Dev2"
+
+
+def test_json_storage_add_vacancies(tmp_path):
+    file_path = tmp_path / "vacancies.json"
+    storage = JSONVacancyStorage(str(file_path))
+
+    storage.add_vacancy(Vacancy("First", "link", None, "desc", "req"))
+    storage.add_vacancies([
+        Vacancy("Second", "link", {"from": 100000}, "desc", "req"),
+        Vacancy("Third", "link", {"to": 150000}, "desc", "req"),
+    ])
+    results = storage.get_vacancies({})
+    assert [v.title for v in results] == ["First", "Second", "Third"]
+
+
+def test_json_storage_writes_one_vacancy_per_line(tmp_path):
+    file_path = tmp_path / "vacancies.json"
+    storage = JSONVacancyStorage(str(file_path))
+    storage.add_vacancy(Vacancy("Dev1", "link", None, "desc", "req"))
+    storage.add_vacancies([Vacancy("Dev2", "link", {"from": 100000}, "desc", "req")])
+
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert '"title":"Dev2"' in lines[1]
+
+
+def test_json_storage_migrates_legacy_array(tmp_path):
+    file_path = tmp_path / "vacancies.json"
+    file_path.write_text(
+        '[{"title": "Old", "link": "link", "salary": null, "description": "desc", "requirements": "req"}]',
+        encoding="utf-8",
+    )
+    storage = JSONVacancyStorage(str(file_path))
+    storage.add_vacancy(Vacancy("New", "link", None, "desc", "req"))
+
+    assert [v.title for v in storage.get_vacancies({})] == ["Old", "New"]
@@ -1,9 +1,16 @@
+import asyncio
+import heapq
+
+import numpy as np
 import pytest
-from src.managers.vacancy_manager import VacancyManager, Vacancy, VacancyStorage
+from src.api import VacancyAPI
+from src.managers.vacancy_manager import VacancyManager, Vacancy, VacancyStorage, _top_n_indices
+from src.models import salary_kernels
+from src.storage import CSVVacancyStorage, ExcelVacancyStorage, ParquetVacancyStorage, SQLiteVacancyStorage
 from typing import Dict, Any, List
 
 
-class FakeAPI:
+class FakeAPI(VacancyAPI):
     def get_vacancies(self, search_query):
         return [
             {
@@ -30,13 +37,16 @@ class InMemoryStorage(VacancyStorage):
     def add_vacancy(self, vacancy):
         self.vacancies.append(vacancy)
 
+    def add_vacancies(self, vacancies):
+        self.vacancies.extend(vacancies)
+
     def get_vacancies(self, criteria):
-        return self._filter_vacancies(self.vacancies, criteria)
+        return self.filter_vacancies(self.vacancies, criteria)
 
     def delete_vacancy(self, criteria):
         self.vacancies.clear()
 
-    def _filter_vacancies(self, vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
+    def filter_vacancies(self, vacancies: List[Vacancy], criteria: Dict[str, Any]) -> List[Vacancy]:
         if not criteria:
             return vacancies
 
@@ -67,11 +77,44 @@ class InMemoryStorage(VacancyStorage):
 
 def test_fetch_and_store_vacancies():
     manager = VacancyManager(api=FakeAPI(), storage=InMemoryStorage())
-    manager.fetch_and_store_vacancies("Python")
+    asyncio.run(manager.fetch_and_store_vacancies("Python"))
     assert len(manager.storage.vacancies) == 2
     assert manager.storage.vacancies[0].title == "Python Dev"
 
 
+def test_fetch_and_store_vacancies_by_pages():
+    class PagedAPI(FakeAPI):
+        async def iter_vacancies(self, search_query):
+            for item in self.get_vacancies(search_query):
+                yield [item]
+
+    storage = InMemoryStorage()
+    batches = []
+    storage.add_vacancies = batches.append
+    manager = VacancyManager(api=PagedAPI(), storage=storage)
+    asyncio.run(manager.fetch_and_store_vacancies("Python"))
+    assert [[v.title for v in batch] for batch in batches] == [["Python Dev"], ["Java Dev"]]
+
+
+@pytest.mark.parametrize("storage_cls, file_name, writer", [
+    pytest.param(ParquetVacancyStorage, "vac.parquet", "_write_table", id="parquet"),
+    pytest.param(ExcelVacancyStorage, "vac.xlsx", "_write_all", id="excel"),
+])
+def test_fetch_and_store_rewrites_file_once(tmp_path, mocker, storage_cls, file_name, writer):
+    class PagedAPI(FakeAPI):
+        async def iter_vacancies(self, search_query):
+            for _ in range(5):
+                yield self.get_vacancies(search_query)
+
+    storage = storage_cls(str(tmp_path / file_name))
+    spy = mocker.spy(storage, writer)
+    manager = VacancyManager(api=PagedAPI(), storage=storage)
+    asyncio.run(manager.fetch_and_store_vacancies("Python"))
+
+    assert spy.call_count == 1
+    assert len(storage.get_vacancies({})) == 10
+
+
 def test_get_top_vacancies_by_salary():
     storage = InMemoryStorage()
     v1 = Vacancy("Low", "link", {"from": 50_000}, "desc", "req")
@@ -85,20 +128,37 @@ def test_get_top_vacancies_by_salary():
     assert [v.title for v in top_vacancies] == ["High", "Mid"]
 
 
-def test_get_vacancies_with_keyword():
+def test_get_vacancies_with_keyword(mocker):
     storage = InMemoryStorage()
     v1 = Vacancy("Python", "link", None, "Python developer", "Python")
     v2 = Vacancy("Java", "link", None, "Java developer", "Java")
     storage.vacancies = [v1, v2]
+    spy = mocker.spy(storage, "filter_vacancies")
 
     manager = VacancyManager(api=None, storage=storage)
     results = manager.get_vacancies_with_keyword("Python")
     assert len(results) == 1
     assert results[0].title == "Python"
+    spy.assert_called_with([v1, v2], {"keyword": "Python"})
+
+
+def test_get_vacancies_with_keyword_uses_storage_filter():
+    class TitleOnlyStorage(InMemoryStorage):
+        def filter_vacancies(self, vacancies, criteria):
+            keyword = criteria.get("keyword", "")
+            return [v for v in vacancies if keyword in v.title]
+
+    storage = TitleOnlyStorage()
+    storage.vacancies = [
+        Vacancy("Python", "link", None, "desc", "req"),
+        Vacancy("Java", "link", None, "Python", "Python"),
+    ]
+    manager = VacancyManager(api=None, storage=storage)
+    assert [v.title for v in manager.get_vacancies_with_keyword("Python")] == ["Python"]
 
 
 def test_fetch_and_store_invalid_vacancy(mocker):
-    class BrokenAPI:
+    class BrokenAPI(VacancyAPI):
         def get_vacancies(self, _):
             return [{"name": "Invalid", "salary": "not a dict"}]
 
@@ -108,5 +168,92 @@ def test_fetch_and_store_invalid_vacancy(mocker):
     # Подавим print() через мок
     mocker.patch("builtins.print")
 
-    manager.fetch_and_store_vacancies("bad")
+    asyncio.run(manager.fetch_and_store_vacancies("bad"))
     assert len(storage.vacancies) == 0
+
+
+def test_get_top_vacancies_by_salary_keeps_order_of_equal_salaries():
+    storage = InMemoryStorage()
+    storage.vacancies = [
+        Vacancy("First", "link", {"from": 100_000}, "desc", "req"),
+        Vacancy("Top", "link", {"from": 200_000}, "desc", "req"),
+        Vacancy("Second", "link", {"from": 100_000}, "desc", "req"),
+        Vacancy("Third", "link", {"from": 100_000}, "desc", "req"),
+    ]
+    manager = VacancyManager(api=None, storage=storage)
+
+    top_vacancies = manager.get_top_vacancies_by_salary(3)
+    assert [v.title for v in top_vacancies] == ["Top", "First", "Second"]
+    assert manager.get_top_vacancies_by_salary(10)[-1].title == "Third"
+
+
+def test_top_n_indices_kernel():
+    avg = np.array([50_000, 90_000, 150_000, 200_000, 150_000, 90_000], dtype=np.int64)
+    assert list(_top_n_indices(avg, 3)) == [3, 2, 4]
+    assert list(_top_n_indices(avg, 5)) == [3, 2, 4, 1, 5]
+    assert list(_top_n_indices(avg, 10)) == [3, 2, 4, 1, 5, 0]
+
+
+def test_get_top_vacancies_by_salary_jit_path(tmp_path, mocker):
+    mocker.patch("src.managers.vacancy_manager.JIT_THRESHOLD", 0)
+    storage = CSVVacancyStorage(str(tmp_path / "vac.csv"))
+    storage.add_vacancies([
+        Vacancy("Low", "link", {"from": 50_000}, "desc", "req"),
+        Vacancy("High", "link", {"from": 150_000, "to": 250_000}, "desc", "req"),
+        Vacancy("Mid", "link", {"to": 100_000}, "desc", "req"),
+        Vacancy("Mid2", "link", {"from": 100_000}, "desc", "req"),
+    ])
+    manager = VacancyManager(api=None, storage=storage)
+    build = mocker.spy(salary_kernels, "average_salaries")
+
+    expected = heapq.nlargest(3, storage.get_vacancies({}), key=lambda v: v.avg_salary)
+    assert [v.title for v in manager.get_top_vacancies_by_salary(3)] == [v.title for v in expected]
+    assert [v.title for v in manager.get_top_vacancies_by_salary(3)] == ["High", "Mid", "Mid2"]
+    # Массивы собираются один раз на загрузку хранилища
+    assert build.call_count == 1
+
+    storage.add_vacancy(Vacancy("Top", "link", {"from": 300_000}, "desc", "req"))
+    assert manager.get_top_vacancies_by_salary(1)[0].title == "Top"
+    assert build.call_count == 2
+
+
+def test_manager_caches_vacancies_until_file_changes(tmp_path, mocker):
+    storage = CSVVacancyStorage(str(tmp_path / "vac.csv"))
+    storage.add_vacancies([
+        Vacancy("Python", "link", {"from": 100_000}, "Python developer", "Python"),
+        Vacancy("Java", "link", {"from": 150_000}, "Java developer", "Java"),
+    ])
+    manager = VacancyManager(api=FakeAPI(), storage=storage)
+    spy = mocker.spy(storage, "get_vacancies")
+
+    assert [v.title for v in manager.get_top_vacancies_by_salary(1)] == ["Java"]
+    assert [v.title for v in manager.get_vacancies_with_keyword("python")] == ["Python"]
+    assert spy.call_count == 1
+
+    storage.add_vacancy(Vacancy("Go", "link", {"from": 200_000}, "Go developer", "Go"))
+    assert [v.title for v in manager.get_top_vacancies_by_salary(1)] == ["Go"]
+    assert spy.call_count == 2
+
+    asyncio.run(manager.fetch_and_store_vacancies("Python"))
+    assert len(manager.get_vacancies_with_keyword("backend")) == 2
+    assert spy.call_count == 3
+
+
+def test_get_vacancies_with_keyword_uses_indexed_storage(tmp_path, mocker):
+    storage = SQLiteVacancyStorage(str(tmp_path / "vac.db"))
+    storage.add_vacancies([
+        Vacancy("Python", "link", None, "Python developer", "Python"),
+        Vacancy("Java", "link", None, "Java developer", "Java"),
+    ])
+    spy = mocker.spy(storage, "get_vacancies")
+    manager = VacancyManager(api=None, storage=storage)
+
+    assert [v.title for v in manager.get_vacancies_with_keyword("python")] == ["Python"]
+    spy.assert_called_once_with({"keyword": "python"})
+
+
+def test_fetch_and_store_vacancies_into_sqlite(tmp_path):
+    storage = SQLiteVacancyStorage(str(tmp_path / "vac.db"))
+    manager = VacancyManager(api=FakeAPI(), storage=storage)
+    asyncio.run(manager.fetch_and_store_vacancies("Python"))
+    assert [v.title for v in storage.get_vacancies({})] == ["Python Dev", "Java Dev"]
@@ -0,0 +1,66 @@
+import pyarrow.parquet as pq
+
+from src.models import Vacancy
+from src.storage.parquet_storage import ParquetVacancyStorage
+
+
+def test_parquet_storage_file_creation(tmp_path):
+    file_path = tmp_path / "vacancies.parquet"
+    ParquetVacancyStorage(str(file_path))
+    assert file_path.exists()
+
+    table = pq.read_table(file_path)
+    assert table.column_names == ["title", "link", "salary", "salary_from", "salary_to", "description", "requirements"]
+    assert table.num_rows == 0
+
+
+def test_parquet_add_get_filter(tmp_path):
+    file_path = tmp_path / "vac.parquet"
+    storage = ParquetVacancyStorage(str(file_path))
+    storage.add_vacancy(Vacancy("A", "url", {"from": 100000}, "desc", "req"))
+    storage.add_vacancies([
+        Vacancy("B", "url", {"from": 40000, "to": 60000}, "desc", "req"),
+        Vacancy("C", "url", None, "desc", "req"),
+    ])
+
+    result = storage.get_vacancies({})
+    assert [v.title for v in result] == ["A", "B", "C"]
+    assert result[1].salary == {"from": 40000, "to": 60000}
+    assert result[2].salary is None
+
+    result = storage.get_vacancies({"min_salary": 60000})
+    assert [v.title for v in result] == ["A"]
+
+
+def test_parquet_delete_vacancy(tmp_path):
+    file_path = tmp_path / "vac.parquet"
+    storage = ParquetVacancyStorage(str(file_path))
+    storage.add_vacancies([
+        Vacancy("X", "url", {"from": 100000}, "desc", "req"),
+        Vacancy("Y", "url", {"from": 50000}, "desc", "req"),
+    ])
+    storage.delete_vacancy({"title": "X"})
+    assert [v.title for v in storage.get_vacancies({})] == ["Y"]
+
+
+def test_parquet_keeps_full_salary(tmp_path):
+    file_path = tmp_path / "vac.parquet"
+    storage = ParquetVacancyStorage(str(file_path))
+    salary = {"from": 1, "to": None, "currency": "RUR", "gross": True}
+    storage.add_vacancy(Vacancy("A", "url", salary, "desc", "req"))
+
+    assert storage.get_vacancies({})[0].salary == salary
+    table = pq.read_table(file_path)
+    assert table.column("salary_from").to_pylist() == [1]
+
+
+def test_parquet_bulk_write_buffers_until_exit(tmp_path, mocker):
+    storage = ParquetVacancyStorage(str(tmp_path / "vac.parquet"))
+    spy = mocker.spy(storage, "_write_table")
+    with storage.bulk_write():
+        storage.add_vacancy(Vacancy("A", "url", {"from": 100000}, "desc", "req"))
+        storage.add_vacancies([Vacancy("B", "url", None, "desc", "req")])
+        assert [v.title for v in storage.get_vacancies({})] == ["A", "B"]
+        assert spy.call_count == 0
+    assert spy.call_count == 1
+    assert [v.title for v in storage.get_vacancies({})] == ["A", "B"]
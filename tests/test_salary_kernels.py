@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+from src.models.salary_kernels import _batch_salary, average_salaries, salary_arrays
+
+
+def test_batch_salary_matches_scalar(vacancy_factory):
+    sal_from = np.array([100000, 120000, -1, -1], dtype=np.int64)
+    sal_to = np.array([200000, -1, 90000, -1], dtype=np.int64)
+    out = np.empty(4, dtype=np.int64)
+    _batch_salary(sal_from, sal_to, out)
+    assert out.tolist() == [150000, 120000, 90000, 0]
+
+    vacancies = [
+        vacancy_factory("Dev", "link", {"from": 100000, "to": 200000}, "desc", "req"),
+        vacancy_factory("Dev", "link", {"from": 120000, "to": None}, "desc", "req"),
+        vacancy_factory("Dev", "link", {"from": None, "to": 90000}, "desc", "req"),
+        vacancy_factory("Dev", "link", None, "desc", "req"),
+    ]
+    arrays = salary_arrays(vacancies)
+    assert arrays[0].tolist() == sal_from.tolist()
+    assert arrays[1].tolist() == sal_to.tolist()
+    _batch_salary(*arrays, out)
+    assert out.tolist() == [v.get_salary() for v in vacancies]
+
+
+def test_average_salaries(vacancy_factory):
+    vacancies = [
+        vacancy_factory("Dev", "link", {"from": 100000, "to": 200000}, "desc", "req"),
+        vacancy_factory("Dev", "link", None, "desc", "req"),
+    ]
+    assert average_salaries(vacancies).tolist() == [150000, 0]
+    assert average_salaries([]).tolist() == []
+
+
+def test_model_import_does_not_load_numba():
+    root = os.path.join(os.path.dirname(__file__), "..")
+    code = "import sys, src.models, src.managers; print('numba' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
@@ -0,0 +1,62 @@
+import sqlite3
+
+from src.models import Vacancy
+from src.storage.sqlite_storage import SQLiteVacancyStorage
+
+
+def _storage(tmp_path):
+    storage = SQLiteVacancyStorage(str(tmp_path / "vacancies.db"))
+    storage.add_vacancies([
+        Vacancy("Python Dev", "link1", {"from": 100000, "to": 150000}, "Python backend", "Django"),
+        Vacancy("Java Dev", "link2", {"from": 150000}, "Java backend", "Spring"),
+        Vacancy("Data Engineer", "link3", None, "ETL", "Знание PYTHON"),
+    ])
+    return storage
+
+
+def test_sqlite_storage_file_creation(tmp_path):
+    file_path = tmp_path / "vacancies.db"
+    storage = SQLiteVacancyStorage(str(file_path))
+    assert file_path.exists()
+    storage.close()
+
+    conn = sqlite3.connect(file_path)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    conn.close()
+    assert {"vacancies", "v_fts", "idx_salary"} <= tables
+
+
+def test_sqlite_add_get_filter(tmp_path):
+    storage = _storage(tmp_path)
+    storage.add_vacancy(Vacancy("Go Dev", "link4", {"to": 90000}, "Go", "gRPC"))
+
+    result = storage.get_vacancies({})
+    assert [v.title for v in result] == ["Python Dev", "Java Dev", "Data Engineer", "Go Dev"]
+    assert result[0].salary == {"from": 100000, "to": 150000}
+    assert result[2].salary is None
+
+    assert [v.title for v in storage.get_vacancies({"min_salary": 120000})] == ["Python Dev", "Java Dev"]
+    assert [v.title for v in storage.get_vacancies({"link": "link4"})] == ["Go Dev"]
+
+
+def test_sqlite_filter_keyword(tmp_path):
+    storage = _storage(tmp_path)
+    assert [v.title for v in storage.get_vacancies({"keyword": "python"})] == ["Python Dev", "Data Engineer"]
+    assert [v.title for v in storage.get_vacancies({"keyword": "знание"})] == ["Data Engineer"]
+    # Короткие ключевые слова не поддерживаются триграммным индексом и проверяются в памяти
+    assert [v.title for v in storage.get_vacancies({"keyword": "go"})] == ["Python Dev"]
+    assert [v.title for v in storage.get_vacancies({"keyword": ["spring", "etl"]})] == ["Java Dev", "Data Engineer"]
+    assert [v.title for v in storage.get_vacancies({"keyword": "python", "min_salary": 100000})] == ["Python Dev"]
+
+
+def test_sqlite_delete_vacancy(tmp_path):
+    storage = _storage(tmp_path)
+    storage.delete_vacancy({"keyword": "backend"})
+    assert [v.title for v in storage.get_vacancies({})] == ["Data Engineer"]
+    assert storage.get_vacancies({"keyword": "python"})[0].title == "Data Engineer"
+
+
+def test_sqlite_filter_keyword_in_title(tmp_path):
+    storage = _storage(tmp_path)
+    assert [v.title for v in storage.get_vacancies({"keyword": "engineer"})] == ["Data Engineer"]
+
@@ -48,3 +48,49 @@ def test_txt_delete_vacancy(tmp_path):
     storage.add_vacancy(v)
     storage.delete_vacancy({"title": "Dev"})
     assert storage.get_vacancies({}) == []
+
+
+def test_txt_add_vacancies(tmp_path):
+    file_path = tmp_path / "vac.txt"
+    storage = TXTVacancyStorage(str(file_path))
+    storage.add_vacancies([
+        Vacancy("A", "url", {"from": 100000}, "desc", "req"),
+        Vacancy("B", "url", None, "desc", "req"),
+    ])
+    assert [v.title for v in storage.get_vacancies({})] == ["A", "B"]
+
+
+def test_txt_bulk_write_keeps_file_open(tmp_path):
+    file_path = tmp_path / "vac.txt"
+    storage = TXTVacancyStorage(str(file_path))
+
+    with storage.bulk_write() as handle:
+        storage.add_vacancy(Vacancy("A", "url", None, "desc", "req"))
+        storage.add_vacancies([Vacancy("B", "url", None, "desc", "req")])
+        assert storage._fh is handle
+    assert handle.closed
+    assert [v.title for v in storage.get_vacancies({})] == ["A", "B"]
+
+
+def test_txt_delete_vacancy_by_keyword(tmp_path):
+    file_path = tmp_path / "vac.txt"
+    storage = TXTVacancyStorage(str(file_path))
+    storage.add_vacancies([
+        Vacancy("A", "url", None, "Python backend", "req"),
+        Vacancy("B", "url", None, "Java backend", "req"),
+    ])
+    storage.delete_vacancy({"keyword": "python"})
+    assert [v.title for v in storage.get_vacancies({})] == ["B"]
+
+
+def test_txt_storage_round_trips_empty_text_fields(tmp_path):
+    storage = TXTVacancyStorage(str(tmp_path / "vacancies.txt"))
+    storage.add_vacancies([
+        Vacancy("Dev", "link", None, None, None),
+        Vacancy("QA", "link", None, "", ""),
+    ])
+
+    results = storage.get_vacancies({})
+    assert [v.title for v in results] == ["Dev", "QA"]
+    assert [(v.description, v.requirements) for v in results] == [("", ""), ("", "")]
+    assert storage.get_vacancies({"keyword": "none"}) == []
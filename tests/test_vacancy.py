@@ -1,39 +1,32 @@
 import pytest
 from src.models.vacancy import Vacancy
 
-def test_vacancy_salary_calculation():
-    vacancy1 = Vacancy("Dev", "link", {"from": 100000, "to": 200000}, "desc", "req")
-    assert vacancy1.get_salary() == 150000
+@pytest.mark.parametrize("salary, expected", [
+    ({"from": 100000, "to": 200000}, 150000),
+    ({"from": 120000, "to": None}, 120000),
+    ({"from": None, "to": 90000}, 90000),
+    (None, 0),
+], ids=["from_and_to", "from_only", "to_only", "no_salary"])
+def test_vacancy_salary(vacancy_factory, salary, expected):
+    vacancy = vacancy_factory("Dev", "link", salary, "desc", "req")
+    assert vacancy.get_salary() == expected
 
-    vacancy2 = Vacancy("Dev", "link", {"from": 120000, "to": None}, "desc", "req")
-    assert vacancy2.get_salary() == 120000
-
-    vacancy3 = Vacancy("Dev", "link", {"from": None, "to": 90000}, "desc", "req")
-    assert vacancy3.get_salary() == 90000
-
-    vacancy4 = Vacancy("Dev", "link", None, "desc", "req")
-    assert vacancy4.get_salary() == 0
-
-def test_vacancy_comparison():
-    v1 = Vacancy("Dev1", "link1", {"from": 100000}, "desc", "req")
-    v2 = Vacancy("Dev2", "link2", {"from": 120000}, "desc", "req")
+def test_vacancy_comparison(vacancy_factory):
+    v1 = vacancy_factory("Dev1", "link1", {"from": 100000}, "desc", "req")
+    v2 = vacancy_factory("Dev2", "link2", {"from": 120000}, "desc", "req")
     assert v2 > v1
     assert v1 < v2
     assert v1 != v2
 
-def test_validate_and_create_valid_data():
-    data = {
-        "name": "Backend Developer",
-        "alternate_url": "https://example.com",
-        "salary": {"from": 100000, "to": 150000},
-        "description": "Great job opportunity",
-        "snippet": {"requirement": "Experience with Django"},
-    }
-    vacancy = Vacancy.validate_and_create(data)
-    assert vacancy.title == "Backend Developer"
-    assert vacancy.get_salary() == 125000
-    assert "Django" in vacancy.requirements
 
+def test_vacancy_self_comparison(vacancy_factory):
+    v1 = vacancy_factory("Dev1", "link1", {"from": 100000}, "desc", "req")
+    assert v1 == v1
+    assert not (v1 != v1)
+    assert not (v1 < v1)
+    assert not (v1 > v1)
+    assert v1 <= v1
+    assert v1 >= v1
 
 def test_vacancy_repr():
     vacancy = Vacancy("Dev", "link", {"from": 100000}, "desc", "req")
@@ -69,3 +62,44 @@ def test_vacancy_ge_operator():
     v1 = Vacancy("A", "link", {"from": 100000}, "desc", "req")
     v2 = Vacancy("B", "link", {"from": 90000}, "desc", "req")
     assert v1 >= v2
+
+
+def test_vacancy_factory_reuses_instances(vacancy_factory):
+    v1 = vacancy_factory("Dev", "link", {"from": 100000}, "desc", "req")
+    assert vacancy_factory("Dev", "link", {"from": 100000}, "desc", "req") is v1
+    assert vacancy_factory("Dev", "link", {"from": 90000}, "desc", "req") is not v1
+
+
+def test_vacancy_salary_fields():
+    v = Vacancy("Dev", "link", {"from": 100000, "to": None, "currency": "RUR"}, "desc", "req")
+    assert v.salary_from == 100000
+    assert v.salary_to == 0
+    assert v.avg_salary == 100000
+
+    empty = Vacancy("Dev", "link", None, "desc", "req")
+    assert (empty.salary_from, empty.salary_to, empty.avg_salary) == (0, 0, 0)
+
+
+def test_vacancy_accepts_missing_text_fields():
+    data = {"name": "Dev", "alternate_url": "link", "description": None, "snippet": {"requirement": None}}
+    vacancy = Vacancy.validate_and_create(data)
+    assert vacancy._desc_lc == ""
+    assert vacancy._req_lc == ""
+
+
+def test_vacancy_has_no_instance_dict():
+    vacancy = Vacancy("Dev", "link", {"from": 100000}, "desc", "req")
+    assert not hasattr(vacancy, "__dict__")
+    assert set(vacancy.to_dict()) == {"title", "link", "salary", "description", "requirements"}
+
+
+def test_vacancy_format_summary():
+    vacancy = Vacancy("Dev", "link", {"from": 100000, "to": 200000}, "d" * 150, "req")
+    summary = vacancy.format_summary()
+    assert summary.startswith("Dev\n   Ссылка: link\n   Зарплата: 150000 RUB\n")
+    assert f"Описание: {'d' * 100}...\n" in summary
+    assert summary.endswith("Требования: req\n")
+    assert vacancy.format_summary() is summary
+
+    assert "Зарплата не указана" in Vacancy("Dev", "link", None, "desc", "req").format_summary()
+
@@ -1,30 +1,25 @@
+import re
+
 import pytest
 from src.models.vacancy import Vacancy
 
-def test_validate_and_create_invalid_salary():
-    bad_data = {
-        "name": "Broken Vacancy",
-        "alternate_url": "http://example.com",
-        "salary": "100000",  # Некорректный тип (строка вместо словаря)
-        "description": "Bad data",
-        "snippet": {"requirement": "None"},
-    }
-
-    with pytest.raises(ValueError, match="Salary must be a dictionary or None"):
-        Vacancy.validate_and_create(bad_data)
+_SALARY_MSG = re.compile(r"Salary must be a dictionary or None")
 
-def test_validate_and_create_missing_fields():
-    minimal_data = {
-        "name": "No Salary",
-        "alternate_url": "http://example.com",
-        "description": "No salary provided",
-        "snippet": {"requirement": ""},
-    }
+def test_validate_and_create_invalid_salary(bad_salary_payload):
+    with pytest.raises(ValueError, match=_SALARY_MSG):
+        Vacancy.validate_and_create(bad_salary_payload)
 
-    vacancy = Vacancy.validate_and_create(minimal_data)
-    assert vacancy.title == "No Salary"
-    assert vacancy.salary is None
-    assert vacancy.get_salary() == 0
+@pytest.mark.parametrize("payload, expected_title, expected_salary", [
+    pytest.param("valid_vacancy_payload", "Backend Developer", 125000, id="valid_data"),
+    pytest.param("minimal_payload", "No Salary", 0, id="missing_fields"),
+])
+def test_validate_and_create(request, payload, expected_title, expected_salary):
+    data = request.getfixturevalue(payload)
+    vacancy = Vacancy.validate_and_create(data)
+    assert vacancy.title == expected_title
+    assert vacancy.salary == data.get("salary")
+    assert vacancy.get_salary() == expected_salary
+    assert vacancy.requirements == data["snippet"]["requirement"]
 
 def test_validate_and_create_missing_title():
     data = {